@@ -6,6 +6,9 @@ Card = collections.namedtuple('Card', ['rank', 'suit'])
 class FrenchDeck:
     ranks = [str(n) for n in range(2, 11)] + list("JQKA")
     suits = 'spades diamonds clubs hearts'.split()
+    rank_values = {rank: value for value, rank in enumerate(ranks)}
+    suit_values = dict(spades=3, hearts=2, diamonds=1, clubs=0)
+    orderings = {}  # policy name -> {card: sort key}, filled in below the class
 
     def __init__(self) -> None:
         self._cards = [Card(rank, suit) for suit in self.suits
@@ -17,6 +20,35 @@ class FrenchDeck:
     def __getitem__(self, position: int) -> Card:
         return self._cards[position]
 
+    def sort(self, policy: str = 'spades_high') -> None:
+        self._cards.sort(key=self.sort_key(policy))
+
+    @classmethod
+    def sort_key(cls, policy: str = 'spades_high'):
+        return cls.orderings[policy].__getitem__
+
+    @classmethod
+    def encode(cls, card: Card) -> int:
+        return cls.orderings['spades_high'][card]
+
+    @classmethod
+    def decode(cls, code: int) -> Card:
+        return _cards_by_code[code]
+
+
+def _ordering(key) -> dict:
+    return {Card(rank, suit): key(FrenchDeck.rank_values[rank], FrenchDeck.suit_values[suit])
+            for suit in FrenchDeck.suits for rank in FrenchDeck.ranks}
+
+
+FrenchDeck.orderings.update(
+    # rank first, then suit; doubles as the packed 0..51 card code
+    spades_high=_ordering(lambda rank, suit: rank << 2 | suit),
+    bridge=_ordering(lambda rank, suit: suit * len(FrenchDeck.ranks) + rank),
+    poker=_ordering(lambda rank, suit: rank),
+)
+_cards_by_code = sorted(FrenchDeck.orderings['spades_high'], key=FrenchDeck.encode)
+
 
 if __name__ == '__main__':
     """
@@ -41,5 +73,14 @@ if __name__ == '__main__':
         return rank_value * len(suit_values) + suit_values[card.suit]
 
 
-    for card in sorted(deck, key=spades_high):
+    for card in sorted(deck, key=FrenchDeck.sort_key('spades_high')):
         print(card)
+
+    print(sorted(deck, key=spades_high) == sorted(deck, key=FrenchDeck.sort_key()))
+    print(sorted(deck, key=FrenchDeck.sort_key('bridge'))[:3])
+    print(FrenchDeck.encode(Card('A', 'spades')), FrenchDeck.decode(51))
+
+    import timeit
+    for key in ('spades_high', "FrenchDeck.sort_key()"):
+        seconds = timeit.timeit('sorted(deck, key={})'.format(key), number=10000, globals=globals())
+        print('{:>22}: {:.2e}s per sort'.format(key, seconds / 10000))
@@ -0,0 +1,134 @@
+import collections.abc
+import numbers
+import random
+
+Card = collections.namedtuple("Card", ["rank", "suit"])
+
+
+def _card_tables(ranks, suits, suit_values):
+    cards = tuple(Card(rank, suit) for rank in ranks
+                  for suit in sorted(suit_values, key=suit_values.get))
+    codes = {card: code for code, card in enumerate(cards)}
+    new_deck_order = bytes(codes[Card(rank, suit)] for suit in suits for rank in ranks)
+    return cards, codes, new_deck_order
+
+
+class CompactDeck(collections.abc.MutableSequence):
+    ranks = [str(n) for n in range(2, 11)] + list("JQKA")
+    suits = 'spades diamonds clubs hearts'.split()
+    suit_values = dict(spades=3, hearts=2, diamonds=1, clubs=0)
+
+    # a card code is rank index * 4 + suit value, so codes sort spades-high
+    cards, codes, new_deck_order = _card_tables(ranks, suits, suit_values)
+
+    def __init__(self, cards=None):
+        if cards is None:
+            self._codes = bytearray(self.new_deck_order)
+        else:
+            self._codes = bytearray(map(self._code, cards))
+
+    @classmethod
+    def _fromcodes(cls, codes):
+        deck = cls.__new__(cls)
+        deck._codes = bytearray(codes)
+        return deck
+
+    @classmethod
+    def _code(cls, card):
+        try:
+            return cls.codes[card]
+        except (KeyError, TypeError):
+            raise ValueError('{!r} is not a card'.format(card)) from None
+
+    def tobytes(self):
+        return bytes(self._codes)
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __iter__(self):
+        return map(self.cards.__getitem__, self._codes)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return self._fromcodes(self._codes[position])
+        elif isinstance(position, numbers.Integral):
+            return self.cards[self._codes[position]]
+        else:
+            msg = '{cls.__name__} indices must be integers'
+            raise TypeError(msg.format(cls=type(self)))
+
+    def __setitem__(self, position, value):
+        if isinstance(position, slice):
+            self._codes[position] = bytes(map(self._code, value))
+        else:
+            self._codes[position] = self._code(value)
+
+    def __delitem__(self, position):
+        del self._codes[position]
+
+    def insert(self, position, value):
+        self._codes.insert(position, self._code(value))
+
+    def __contains__(self, card):
+        code = self.codes.get(card) if isinstance(card, tuple) else None
+        return code is not None and code in self._codes
+
+    def index(self, card, start=0, stop=None):
+        stop = len(self._codes) if stop is None else stop
+        return self._codes.index(self._code(card), start, stop)
+
+    def count(self, card):
+        return self._codes.count(self._code(card))
+
+    def extend(self, cards):
+        if isinstance(cards, CompactDeck):
+            self._codes.extend(cards._codes)
+        else:
+            self._codes.extend(map(self._code, cards))
+
+    def reverse(self):
+        self._codes.reverse()
+
+    def __eq__(self, other):
+        if isinstance(other, CompactDeck):
+            return self._codes == other._codes
+        return NotImplemented
+
+    def __repr__(self):
+        return '{}(<{} cards>)'.format(type(self).__name__, len(self))
+
+    def shuffle(self, rnd=random):
+        rnd.shuffle(self._codes)
+
+    def deal(self, hands, cards_per_hand):
+        needed = hands * cards_per_hand
+        if needed > len(self._codes):
+            raise ValueError('cannot deal {} cards from {} left'.format(needed, len(self._codes)))
+        dealt = self._codes[:needed]
+        del self._codes[:needed]
+        return [self._fromcodes(dealt[i::hands]) for i in range(hands)]
+
+
+if __name__ == '__main__':
+    import sys
+    import time
+
+    from FrenchDeck2 import FrenchDeck2
+
+    deck = CompactDeck()
+    print(deck, deck[0], deck[-1], list(deck) == list(FrenchDeck2()))
+    deck.shuffle(random.Random(7))
+    hands = deck.deal(4, 5)
+    print([list(hand) for hand in hands[:2]], len(deck))
+    print(Card('A', 'spades') in deck or any(Card('A', 'spades') in h for h in hands))
+
+    for cls, shuffle in ((FrenchDeck2, random.shuffle), (CompactDeck, CompactDeck.shuffle)):
+        t0 = time.perf_counter()
+        decks = [cls() for _ in range(100000)]
+        for d in decks:
+            shuffle(d)
+        elapsed = time.perf_counter() - t0
+        size = sys.getsizeof(decks[0]._codes if cls is CompactDeck else decks[0]._cards)
+        print('{:>11}: 100,000 build + shuffle {:.3f}s, {} bytes per deck storage'.format(
+            cls.__name__, elapsed, size))
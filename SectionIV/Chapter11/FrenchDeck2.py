@@ -1,9 +1,9 @@
-import collections
+import collections.abc
 
 Card = collections.namedtuple("Card", ["rank", "suit"])
 
 
-class FrenchDeck2(collections.MutableSequence):
+class FrenchDeck2(collections.abc.MutableSequence):
     ranks = [str(n) for n in range(2, 11)] + list("JQKA")
     suits = 'spades diamonds clubs hearts'.split()
 
@@ -0,0 +1,173 @@
+import functools
+import itertools
+import math
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from CompactDeck import CompactDeck
+
+HAND_NAMES = ['high card', 'pair', 'two pair', 'three of a kind', 'straight',
+              'flush', 'full house', 'four of a kind', 'straight flush']
+(HIGH_CARD, PAIR, TWO_PAIR, TRIPS, STRAIGHT,
+ FLUSH, FULL_HOUSE, QUADS, STRAIGHT_FLUSH) = range(len(HAND_NAMES))
+
+# a rank multiset is identified by the product of one prime per rank
+PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+WHEEL = 0b1000000001111  # A-2-3-4-5
+
+_CODE_PRIMES = [PRIMES[code >> 2] for code in range(52)]
+_CODE_BITS = [1 << (code >> 2) for code in range(52)]
+
+
+def _score(category, ranks):
+    score = category
+    for rank in itertools.islice(itertools.chain(ranks, itertools.repeat(0)), 5):
+        score = score << 4 | rank
+    return score
+
+
+def _straight_high(mask):
+    for high in range(12, 3, -1):
+        run = 0b11111 << (high - 4)
+        if mask & run == run:
+            return high
+    return 3 if mask & WHEEL == WHEEL else None
+
+
+def _top_ranks(mask):
+    return [rank for rank in range(12, -1, -1) if mask >> rank & 1]
+
+
+def _flush_score(mask):
+    if bin(mask).count('1') < 5:
+        return 0
+    high = _straight_high(mask)
+    if high is not None:
+        return _score(STRAIGHT_FLUSH, [high])
+    return _score(FLUSH, _top_ranks(mask)[:5])
+
+
+def _rank_score(ranks):
+    counts = sorted(((count, rank) for rank, count in enumerate(ranks) if count),
+                    reverse=True)
+    mask = sum(1 << rank for rank, count in enumerate(ranks) if count)
+    (first_count, first), (second_count, second) = counts[0], counts[1]
+    straight = _straight_high(mask)
+
+    def kickers(*used):
+        return [rank for rank in _top_ranks(mask) if rank not in used]
+
+    if first_count == 4:
+        return _score(QUADS, [first] + kickers(first)[:1])
+    elif first_count == 3 and second_count >= 2:
+        return _score(FULL_HOUSE, [first, second])
+    elif straight is not None:
+        return _score(STRAIGHT, [straight])
+    elif first_count == 3:
+        return _score(TRIPS, [first] + kickers(first)[:2])
+    elif first_count == 2 and second_count == 2:
+        return _score(TWO_PAIR, [first, second] + kickers(first, second)[:1])
+    elif first_count == 2:
+        return _score(PAIR, [first] + kickers(first)[:3])
+    else:
+        return _score(HIGH_CARD, _top_ranks(mask)[:5])
+
+
+FLUSH_TABLE = array('L', map(_flush_score, range(1 << 13)))
+
+
+@functools.lru_cache()
+def rank_table(hand_size):
+    table = {}
+    for ranks in itertools.combinations_with_replacement(range(13), hand_size):
+        counts = [0] * 13
+        for rank in ranks:
+            counts[rank] += 1
+        if max(counts) <= 4:
+            table[math.prod(PRIMES[rank] for rank in ranks)] = _rank_score(counts)
+    return table
+
+
+@functools.lru_cache()
+def _numpy_tables(hand_size):
+    table = rank_table(hand_size)
+    products = numpy.array(sorted(table), dtype=numpy.int64)
+    scores = numpy.array([table[product] for product in products.tolist()], dtype=numpy.uint32)
+    return products, scores, numpy.array(FLUSH_TABLE, dtype=numpy.uint32)
+
+
+def _codes(hand):
+    if isinstance(hand, (bytes, bytearray, memoryview)):
+        return hand
+    elif isinstance(hand, CompactDeck):
+        return hand.tobytes()
+    return bytes(code if isinstance(code, int) else CompactDeck.codes[code] for code in hand)
+
+
+def evaluate(hand):
+    codes = _codes(hand)
+    product = 1
+    suit_masks = [0, 0, 0, 0]
+    for code in codes:
+        product *= _CODE_PRIMES[code]
+        suit_masks[code & 3] |= _CODE_BITS[code]
+    return max(rank_table(len(codes))[product], *map(FLUSH_TABLE.__getitem__, suit_masks))
+
+
+def encode_hands(hands):
+    return b''.join(map(_codes, hands))
+
+
+def evaluate_batch(codes, hand_size):
+    if len(codes) % hand_size:
+        raise ValueError('batch length is not a multiple of {}'.format(hand_size))
+    if numpy is None:
+        memv = memoryview(codes).cast('B')
+        return array('L', (evaluate(memv[i:i + hand_size])
+                           for i in range(0, len(memv), hand_size)))
+
+    products, scores, flush_table = _numpy_tables(hand_size)
+    hands = numpy.frombuffer(codes, dtype=numpy.uint8).reshape(-1, hand_size)
+    ranks = hands >> 2
+    suits = hands & 3
+    product = numpy.array(PRIMES, dtype=numpy.int64)[ranks].prod(axis=1)
+    best = scores[numpy.searchsorted(products, product)]
+    bits = numpy.left_shift(numpy.uint16(1), ranks, dtype=numpy.uint16)
+    for suit in range(4):
+        masks = numpy.bitwise_or.reduce(numpy.where(suits == suit, bits, 0), axis=1)
+        numpy.maximum(best, flush_table[masks], out=best)
+    return best
+
+
+def hand_name(score):
+    return HAND_NAMES[score >> 20]
+
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    from CompactDeck import Card
+
+    hand = [Card('A', 'spades'), Card('K', 'spades'), Card('Q', 'spades'),
+            Card('J', 'spades'), Card('10', 'spades'), Card('2', 'hearts'), Card('2', 'clubs')]
+    print(hand_name(evaluate(hand[:5])), hand_name(evaluate(hand[2:])), hand_name(evaluate(hand)))
+
+    rnd = random.Random(0)
+    for hand_size in (5, 7):
+        rank_table(hand_size)
+        codes = b''.join(bytes(rnd.sample(range(52), hand_size)) for _ in range(200000))
+        t0 = time.perf_counter()
+        evaluate_batch(codes, hand_size)
+        elapsed = time.perf_counter() - t0
+        print('{}-card batch: {:,.0f} hands/s'.format(hand_size, 200000 / elapsed))
+
+        t0 = time.perf_counter()
+        for i in range(0, 20000 * hand_size, hand_size):
+            evaluate(codes[i:i + hand_size])
+        elapsed = time.perf_counter() - t0
+        print('{}-card one by one: {:,.0f} hands/s'.format(hand_size, 20000 / elapsed))
@@ -1,3 +1,4 @@
+import itertools
 import random
 
 from Tombola import Tombola
@@ -5,21 +6,100 @@ from Tombola import Tombola
 
 class LotteryBlower(Tombola):
     def __init__(self, iterable):
-        self._balls = list(iterable)
+        self._balls = []
+        # while every ball is hashable and comparable, _balls holds [ball, group,
+        # position] handles, _groups maps each key to the handles of the balls equal
+        # to it and _sorted_keys keeps those keys sorted; otherwise _balls holds the
+        # balls themselves and the other two are None
+        self._groups = {}
+        self._sorted_keys = []
+        self.load(iterable)
 
     def load(self, iterable):
-        self._balls.extend(iterable)
+        balls = list(iterable)
+        if self._groups is None:
+            self._balls.extend(balls)
+            return
+        try:
+            handles, new_keys = [], []
+            for ball in balls:
+                group = self._groups.get(ball)
+                if group is None:
+                    group = self._groups[ball] = []
+                    new_keys.append(ball)
+                handle = [ball, group, len(group)]
+                group.append(handle)
+                handles.append(handle)
+            # two sorted runs: the sort merges them in linear time
+            self._sorted_keys.extend(sorted(new_keys))
+            self._sorted_keys.sort()
+        except TypeError:
+            self._balls = [handle[0] for handle in self._balls]
+            self._balls.extend(balls)
+            self._groups = self._sorted_keys = None
+        else:
+            self._balls.extend(handles)
 
     def pick(self):
         try:
             position = random.randrange(len(self._balls))
         except ValueError:
-            raise LookupError('pick from empty BingoCage')
+            raise LookupError('pick from empty LotteryBlower')
 
-        return self._balls.pop(position)
+        balls = self._balls
+        balls[position], balls[-1] = balls[-1], balls[position]
+        picked = balls.pop()
+        if self._groups is None:
+            return picked
+        ball, group, index = picked
+        last = group.pop()
+        if last is not picked:
+            group[index] = last
+            last[2] = index
+        return ball
 
     def loaded(self):
         return bool(self._balls)
 
+    def _compact(self):
+        self._sorted_keys = [key for key in self._sorted_keys if self._groups[key]]
+        self._groups = {key: self._groups[key] for key in self._sorted_keys}
+
     def inspect(self):
-        return tuple(sorted(self._balls))
+        if self._groups is None:
+            return tuple(sorted(self._balls))
+        if len(self._sorted_keys) > 2 * len(self._balls) + 64:
+            self._compact()
+        groups = self._groups
+        handles = itertools.chain.from_iterable(groups[key] for key in self._sorted_keys)
+        return tuple(handle[0] for handle in handles)
+
+
+if __name__ == '__main__':
+    import time
+
+    def drain(blower):
+        t0 = time.perf_counter()
+        while blower.loaded():
+            blower.pick()
+        return time.perf_counter() - t0
+
+    class ListPopBlower(LotteryBlower):
+        def __init__(self, iterable):
+            self._balls = list(iterable)
+
+        def pick(self):
+            return self._balls.pop(random.randrange(len(self._balls)))
+
+    for size in (10 ** 4, 10 ** 5, 10 ** 6):
+        blower = LotteryBlower(range(size))
+        t0 = time.perf_counter()
+        for _ in range(size // 2):
+            blower.pick()
+        blower.inspect()
+        half = time.perf_counter() - t0
+        print('{:>9,} balls: swap-and-pop drain {:.3f}s, half drain + inspect {:.3f}s'.format(
+            size, drain(LotteryBlower(range(size))), half))
+        if size <= 10 ** 5:
+            print('{:>16}list.pop(position) drain {:.3f}s'.format(
+                '', drain(ListPopBlower(range(size)))))
@@ -0,0 +1,79 @@
+import collections
+import contextlib
+import os
+import random
+import time
+from concurrent import futures
+
+from FrenchDeck2 import FrenchDeck2
+from HandEvaluator import evaluate, hand_name
+
+SimulationReport = collections.namedtuple(
+    'SimulationReport', 'counts trials seconds trials_per_second')
+
+
+def poker_hand(hand):
+    return hand_name(evaluate(hand))
+
+
+def _run_chunk(seed, trials, hands, cards_per_hand, statistic, deck_cls):
+    rnd = random.Random(seed)
+    deck = deck_cls()
+    shuffle = getattr(deck, 'shuffle', None) or (lambda rnd: rnd.shuffle(deck))
+    dealt = hands * cards_per_hand
+    counts = collections.Counter()
+    for _ in range(trials):
+        shuffle(rnd)
+        top = deck[:dealt]
+        counts.update(statistic(top[i::hands]) for i in range(hands))
+    return counts
+
+
+def _chunks(trials, chunk_size, seed):
+    # chunk seeds come from one root stream, so results do not depend on the pool size
+    root = random.Random(seed)
+    for start in range(0, trials, chunk_size):
+        yield root.getrandbits(128), min(chunk_size, trials - start)
+
+
+def _pool(workers, executor):
+    if executor is not None:
+        return contextlib.nullcontext(executor)
+    return futures.ProcessPoolExecutor(workers)
+
+
+def simulate(trials, hands=4, cards_per_hand=5, statistic=poker_hand, seed=None,
+             workers=None, executor=None, chunk_size=10000, deck_cls=FrenchDeck2):
+    if hands * cards_per_hand > len(deck_cls()):
+        raise ValueError('cannot deal {} hands of {} cards'.format(hands, cards_per_hand))
+    workers = workers or os.cpu_count()
+    counts = collections.Counter()
+
+    t0 = time.perf_counter()
+    if workers == 1 and executor is None:
+        for chunk_seed, chunk_trials in _chunks(trials, chunk_size, seed):
+            counts.update(_run_chunk(chunk_seed, chunk_trials, hands, cards_per_hand,
+                                     statistic, deck_cls))
+    else:
+        with _pool(workers, executor) as pool:
+            jobs = [pool.submit(_run_chunk, chunk_seed, chunk_trials, hands, cards_per_hand,
+                                statistic, deck_cls)
+                    for chunk_seed, chunk_trials in _chunks(trials, chunk_size, seed)]
+            for job in futures.as_completed(jobs):
+                counts.update(job.result())
+    seconds = time.perf_counter() - t0
+    return SimulationReport(counts, trials, seconds, trials / seconds if seconds else 0.0)
+
+
+if __name__ == '__main__':
+    from CompactDeck import CompactDeck
+
+    for deck_cls in (FrenchDeck2, CompactDeck):
+        for workers in sorted({1, os.cpu_count()}):
+            report = simulate(40000, seed=42, workers=workers, deck_cls=deck_cls)
+            print('{:>11}, {:>2} workers: {:,.0f} trials/s'.format(
+                deck_cls.__name__, workers, report.trials_per_second))
+
+    total = sum(report.counts.values())
+    for name, count in report.counts.most_common():
+        print('{:>16}: {:.5f}'.format(name, count / total))
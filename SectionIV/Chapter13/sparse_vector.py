@@ -0,0 +1,206 @@
+import bisect
+import functools
+import heapq
+import itertools
+import math
+import numbers
+import operator
+import reprlib
+import struct
+from array import array
+
+from vector_v7 import Vector
+
+SPARSE_MARKER = b'S'
+HEADER = struct.Struct('=ccQQ')  # marker, typecode, size, number of stored values
+
+
+class SparseVector:
+    typecode = 'd'
+    index_typecode = 'I'
+
+    def __init__(self, components=()):
+        indices = array(self.index_typecode)
+        values = array(self.typecode)
+        size = 0
+        for size, value in enumerate(components, 1):
+            if value:
+                indices.append(size - 1)
+                values.append(value)
+        self._size = size
+        self._indices = indices
+        self._values = values
+
+    @classmethod
+    def _fromarrays(cls, size, indices, values):
+        vector = cls.__new__(cls)
+        vector._size = size
+        vector._indices = indices
+        vector._values = values
+        return vector
+
+    @classmethod
+    def _fromsorted(cls, size, pairs):
+        indices = array(cls.index_typecode)
+        values = array(cls.typecode)
+        for index, value in pairs:
+            if value:
+                indices.append(index)
+                values.append(value)
+        return cls._fromarrays(size, indices, values)
+
+    @classmethod
+    def fromitems(cls, size, items):
+        pairs = sorted(items)
+        if pairs and not 0 <= pairs[0][0] <= pairs[-1][0] < size:
+            raise IndexError('{} index out of range'.format(cls.__name__))
+        return cls._fromsorted(size, pairs)
+
+    def items(self):
+        return zip(self._indices, self._values)
+
+    def todense(self):
+        components = array(self.typecode, bytes(self._size * array(self.typecode).itemsize))
+        for index, value in self.items():
+            components[index] = value
+        return Vector._fromstorage(components)
+
+    @property
+    def nnz(self):
+        return len(self._values)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        position = 0
+        for index, value in self.items():
+            yield from itertools.repeat(0.0, index - position)
+            yield value
+            position = index + 1
+        yield from itertools.repeat(0.0, self._size - position)
+
+    def __repr__(self):
+        return '{}({}, {})'.format(type(self).__name__, self._size,
+                                   reprlib.repr(dict(self.items())))
+
+    def __str__(self):
+        return str(tuple(self))
+
+    def __bytes__(self):
+        header = HEADER.pack(SPARSE_MARKER, self.typecode.encode(), self._size, self.nnz)
+        return header + bytes(self._indices) + bytes(self._values)
+
+    @classmethod
+    def frombytes(cls, octets):
+        if octets[:1] != SPARSE_MARKER:
+            return cls(Vector.frombytes(octets))
+        memv = memoryview(octets)
+        _, typecode, size, nnz = HEADER.unpack(memv[:HEADER.size])
+        index_end = HEADER.size + nnz * array(cls.index_typecode).itemsize
+        indices = array(cls.index_typecode, memv[HEADER.size:index_end].cast(cls.index_typecode))
+        values = array(cls.typecode, memv[index_end:].cast(typecode.decode()))
+        return cls._fromarrays(size, indices, values)
+
+    def __getitem__(self, index):
+        cls = type(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step != 1:
+                return cls(self.todense()[index])
+            lo = bisect.bisect_left(self._indices, start)
+            hi = bisect.bisect_left(self._indices, stop)
+            indices = array(self.index_typecode, (i - start for i in self._indices[lo:hi]))
+            return cls._fromarrays(max(stop - start, 0), indices, self._values[lo:hi])
+        elif isinstance(index, numbers.Integral):
+            if index < 0:
+                index += self._size
+            if not 0 <= index < self._size:
+                raise IndexError('{} index out of range'.format(cls.__name__))
+            position = bisect.bisect_left(self._indices, index)
+            if position < self.nnz and self._indices[position] == index:
+                return self._values[position]
+            return 0.0
+        else:
+            msg = '{cls.__name__} indices must be integers'
+            raise TypeError(msg.format(cls=cls))
+
+    def __eq__(self, other):
+        if isinstance(other, SparseVector):
+            return (self._size == other._size and
+                    self._indices == other._indices and
+                    self._values == other._values)
+        elif isinstance(other, Vector):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        else:
+            return NotImplemented
+
+    def __hash__(self):
+        return functools.reduce(operator.xor, map(hash, self._values), 0)
+
+    def __abs__(self):
+        return math.sqrt(sum(x * x for x in self._values))
+
+    def __bool__(self):
+        return bool(abs(self))
+
+    def __neg__(self):
+        return SparseVector._fromarrays(self._size, array(self.index_typecode, self._indices),
+                                        array(self.typecode, (-x for x in self._values)))
+
+    def __add__(self, other):
+        if isinstance(other, SparseVector):
+            sums = ((index, sum(value for _, value in group))
+                    for index, group in _merged(self, other))
+            return SparseVector._fromsorted(max(self._size, other._size), sums)
+        elif isinstance(other, Vector):
+            result = array(self.typecode, other._components)
+            if len(result) < self._size:
+                result.extend(itertools.repeat(0.0, self._size - len(result)))
+            for index, value in self.items():
+                result[index] += value
+            return Vector._fromstorage(result)
+        else:
+            return NotImplemented
+
+    def __radd__(self, other):
+        return self + other
+
+    def __mul__(self, scalar):
+        if isinstance(scalar, numbers.Real):
+            products = ((index, value * scalar) for index, value in self.items())
+            return SparseVector._fromsorted(self._size, products)
+        else:
+            return NotImplemented
+
+    def __rmul__(self, scalar):
+        return self * scalar
+
+    def __matmul__(self, other):
+        if isinstance(other, SparseVector):
+            pairs = ([value for _, value in group] for _, group in _merged(self, other))
+            return sum(pair[0] * pair[1] for pair in pairs if len(pair) == 2)
+        elif isinstance(other, Vector):
+            components = other._components
+            size = len(components)
+            return sum(value * components[index] for index, value in self.items()
+                       if index < size)
+        else:
+            return NotImplemented
+
+    def __rmatmul__(self, other):
+        return self @ other
+
+
+def _merged(a, b):
+    pairs = heapq.merge(a.items(), b.items(), key=operator.itemgetter(0))
+    return itertools.groupby(pairs, key=operator.itemgetter(0))
+
+
+if __name__ == '__main__':
+    dense = Vector([0, 0, 3, 0, 4, 0, 0, 0])
+    sparse = SparseVector(dense)
+    print(repr(sparse), sparse.nnz, abs(sparse), sparse == dense, hash(sparse) == hash(dense))
+    print(sparse + SparseVector.fromitems(8, [(4, -4), (7, 1)]))
+    print(sparse + Vector([1, 1]), sparse @ dense, dense @ sparse, sparse * 2)
+    print(len(bytes(sparse)), len(bytes(dense)), SparseVector.frombytes(bytes(sparse)) == sparse)
@@ -0,0 +1,12 @@
+import timeit
+
+from vector_v6 import Vector as VectorV6
+from vector_v7 import Vector as VectorV7
+
+
+if __name__ == '__main__':
+    for label, cls in (('__getattr__ (v6)', VectorV6), ('descriptors (v7)', VectorV7)):
+        v = cls([1, 2, 3, 4])
+        elapsed = min(timeit.repeat('v.x + v.y + v.z + v.t', globals={'v': v},
+                                    number=10 ** 5, repeat=5))
+        print('{:<18} {:.1f} ns per attribute read'.format(label, elapsed / (4 * 10 ** 5) * 1e9))
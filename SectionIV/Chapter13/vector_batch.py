@@ -0,0 +1,150 @@
+import functools
+import math
+import numbers
+import operator
+
+import numpy
+
+from vector_v7 import Vector
+
+
+class VectorBatch:
+    typecode = 'd'
+
+    def __init__(self, vectors):
+        if isinstance(vectors, numpy.ndarray):
+            rows = vectors
+        else:
+            rows = [numpy.asarray(v._ndarray() if isinstance(v, Vector) else list(v),
+                                  dtype=self.typecode)
+                    for v in vectors]
+            if len({len(row) for row in rows}) > 1:
+                raise ValueError('all vectors in a batch must have the same dimension')
+            if not rows:
+                rows = numpy.empty((0, 0), dtype=self.typecode)
+        self._components = numpy.array(rows, dtype=self.typecode, ndmin=2)
+
+    @classmethod
+    def _fromstorage(cls, components):
+        batch = cls.__new__(cls)
+        batch._components = components
+        return batch
+
+    @property
+    def dim(self):
+        return self._components.shape[1]
+
+    def __len__(self):
+        return self._components.shape[0]
+
+    def __iter__(self):
+        return (Vector._fromstorage(row) for row in self._components)
+
+    def __repr__(self):
+        return '{}(<{} vectors of dimension {}>)'.format(
+            type(self).__name__, len(self), self.dim)
+
+    def __getitem__(self, index):
+        cls = type(self)
+        if isinstance(index, slice):
+            return cls._fromstorage(self._components[index])
+        elif isinstance(index, numbers.Integral):
+            return Vector._fromstorage(self._components[index])
+        else:
+            msg = '{cls.__name__} indices must be integers'
+            raise TypeError(msg.format(cls=cls))
+
+    def __abs__(self):
+        return numpy.sqrt(numpy.einsum('ij,ij->i', self._components, self._components))
+
+    def __neg__(self):
+        return VectorBatch._fromstorage(-self._components)
+
+    def _combined(self, other, op, reflected=False):
+        other = _as_rows(other)
+        if other is None:
+            return NotImplemented
+        dim = max(self.dim, other.shape[1])
+        rows, other = _padded(self._components, dim), _padded(other, dim)
+        if reflected:
+            rows, other = other, rows
+        return VectorBatch._fromstorage(op(rows, other))
+
+    def __add__(self, other):
+        return self._combined(other, operator.add)
+
+    def __radd__(self, other):
+        return self + other
+
+    def __sub__(self, other):
+        return self._combined(other, operator.sub)
+
+    def __rsub__(self, other):
+        return self._combined(other, operator.sub, reflected=True)
+
+    def __mul__(self, scalar):
+        if isinstance(scalar, numbers.Real):
+            return VectorBatch._fromstorage(self._components * float(scalar))
+        else:
+            return NotImplemented
+
+    def __rmul__(self, scalar):
+        return self * scalar
+
+    def dot(self, other):
+        other = _as_rows(other)
+        if other is None:
+            raise TypeError('dot() expects a Vector or a VectorBatch')
+        dim = max(self.dim, other.shape[1])
+        return numpy.einsum('ij,ij->i', _padded(self._components, dim),
+                            _padded(other, dim))
+
+    def cosine(self, other):
+        dots = self.dot(other)
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            return dots / (abs(self) * abs(other))
+
+    def angles(self):
+        components = self._components
+        squares = components * components
+        tail_norms = numpy.sqrt(numpy.cumsum(squares[:, ::-1], axis=1)[:, ::-1])
+        angles = numpy.arctan2(tail_norms[:, 1:], components[:, :-1])
+        if angles.shape[1]:
+            last = angles[:, -1]
+            negative = components[:, -1] < 0
+            last[negative] = 2 * math.pi - last[negative]
+        return angles
+
+    def hashes(self):
+        return numpy.fromiter(
+            (functools.reduce(operator.xor, map(hash, row), 0)
+             for row in self._components.tolist()),
+            dtype=numpy.int64, count=len(self))
+
+
+def _as_rows(other):
+    if isinstance(other, VectorBatch):
+        return other._components
+    elif isinstance(other, Vector):
+        return other._ndarray().reshape(1, -1)
+    return None
+
+
+def _padded(rows, dim):
+    if rows.shape[1] == dim:
+        return rows
+    padded = numpy.zeros((rows.shape[0], dim), dtype=rows.dtype)
+    padded[:, :rows.shape[1]] = rows
+    return padded
+
+
+if __name__ == '__main__':
+    batch = VectorBatch([[3, 4], [1, 1], [-1, 0]])
+    print(batch)
+    print(abs(batch))
+    print(batch.dot(Vector([1, 0])))
+    print(batch.cosine(Vector([1, 0])))
+    print(batch.angles())
+    print(batch.hashes(), [hash(v) for v in batch])
+    print(list(batch + Vector([10, 10])))
+    print(list(batch - batch[1:2]), list(Vector([10, 10]) - batch))
@@ -0,0 +1,123 @@
+import collections.abc
+import mmap
+import numbers
+import struct
+from array import array
+
+from vector_v7 import Vector
+
+MAGIC = b'VEC1'
+FOOTER = struct.Struct('=QQ4s')  # vector count, index offset, magic
+
+
+class VectorWriter:
+    def __init__(self, path):
+        self._fp = open(path, 'wb')
+        self._fp.write(MAGIC)
+        self._offsets = array('Q', [len(MAGIC)])
+
+    def append(self, vector):
+        components = memoryview(vector._components)
+        if not components.c_contiguous:
+            components = components.tobytes()
+        self._fp.write(bytes([ord(vector.typecode)]))
+        self._fp.write(components)
+        self._offsets.append(self._fp.tell())
+
+    def extend(self, vectors):
+        for vector in vectors:
+            self.append(vector)
+
+    def close(self):
+        if self._fp.closed:
+            return
+        index_offset = self._fp.tell()
+        self._fp.write(self._offsets)
+        self._fp.write(FOOTER.pack(len(self._offsets) - 1, index_offset, MAGIC))
+        self._fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class VectorReader(collections.abc.Sequence):
+    def __init__(self, path, vector_cls=Vector):
+        self.vector_cls = vector_cls
+        with open(path, 'rb') as fp:
+            self._mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._memv = memoryview(self._mapped)
+
+        count, index_offset, magic = FOOTER.unpack(self._memv[-FOOTER.size:])
+        if self._memv[:len(MAGIC)] != MAGIC or magic != MAGIC:
+            raise ValueError('{!r} is not a vector container'.format(path))
+        self._offsets = self._memv[index_offset:-FOOTER.size].cast('Q')
+        if len(self._offsets) != count + 1:
+            raise ValueError('{!r} has a corrupt index'.format(path))
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        cls = type(self)
+        if not isinstance(index, numbers.Integral):
+            msg = '{cls.__name__} indices must be integers'
+            raise TypeError(msg.format(cls=cls))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('{} index out of range'.format(cls.__name__))
+
+        record = self._memv[self._offsets[index]:self._offsets[index + 1]]
+        typecode = chr(record[0])
+        if typecode != self.vector_cls.typecode:
+            return self.vector_cls.frombytes(record)
+        return self.vector_cls._fromstorage(record[1:].cast(typecode))
+
+    def close(self):
+        self._offsets.release()
+        self._memv.release()
+        self._mapped = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+if __name__ == '__main__':
+    import os
+    import pickle
+    import tempfile
+    import time
+
+    vectors = [Vector(range(n, n + 100)) for n in range(10000)]
+    directory = tempfile.mkdtemp()
+    container_path = os.path.join(directory, 'vectors.vec')
+    pickle_path = os.path.join(directory, 'vectors.pickle')
+
+    t0 = time.perf_counter()
+    with VectorWriter(container_path) as writer:
+        writer.extend(vectors)
+    print('container write: {:.4f}s, {:,} bytes'.format(
+        time.perf_counter() - t0, os.path.getsize(container_path)))
+
+    t0 = time.perf_counter()
+    with open(pickle_path, 'wb') as fp:
+        pickle.dump(vectors, fp)
+    print('pickle write:    {:.4f}s, {:,} bytes'.format(
+        time.perf_counter() - t0, os.path.getsize(pickle_path)))
+
+    t0 = time.perf_counter()
+    reader = VectorReader(container_path)
+    vector = reader[9876]
+    print('container open + fetch: {:.6f}s'.format(time.perf_counter() - t0))
+    print(len(reader), vector == vectors[9876], repr(vector))
+
+    t0 = time.perf_counter()
+    with open(pickle_path, 'rb') as fp:
+        vector = pickle.load(fp)[9876]
+    print('pickle load + fetch:    {:.6f}s'.format(time.perf_counter() - t0))
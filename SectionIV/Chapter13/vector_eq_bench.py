@@ -0,0 +1,18 @@
+import timeit
+
+from vector_v7 import Vector
+
+
+def generic_eq(a, b):
+    return len(a) == len(b) and all(x == y for x, y in zip(a, b))
+
+
+if __name__ == '__main__':
+    for size in (10, 10 ** 4, 10 ** 6):
+        v1 = Vector(range(size))
+        v2 = Vector(range(size))
+        number = max(1, 10 ** 6 // size)
+        generic = min(timeit.repeat(lambda: generic_eq(v1, v2), number=number, repeat=3))
+        buffer = min(timeit.repeat(lambda: v1 == v2, number=number, repeat=3))
+        print('{:>9,} components: generic {:.2e}s  buffer {:.2e}s  ({:.0f}x)'.format(
+            size, generic / number, buffer / number, generic / buffer))
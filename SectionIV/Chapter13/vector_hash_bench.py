@@ -0,0 +1,26 @@
+import random
+import timeit
+
+from vector_v7 import Vector, FrozenVector
+
+DIMENSIONS = 1000
+KEYS = 100
+
+
+def lookup_time(cls):
+    rnd = random.Random(42)
+    keys = [cls(rnd.random() for _ in range(DIMENSIONS)) for _ in range(KEYS)]
+    table = {key: n for n, key in enumerate(keys)}
+
+    def lookups():
+        for key in keys:
+            table[key]
+
+    return min(timeit.repeat(lookups, number=100, repeat=5))
+
+
+if __name__ == '__main__':
+    for cls in (Vector, FrozenVector):
+        elapsed = lookup_time(cls)
+        rate = KEYS * 100 / elapsed
+        print('{:<12} {:>12,.0f} lookups/s'.format(cls.__name__, rate))
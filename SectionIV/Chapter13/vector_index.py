@@ -0,0 +1,100 @@
+import random
+
+from vector_v7 import Vector, numpy
+from vector_container import VectorReader, VectorWriter
+from vector_search import nearest
+
+
+class LSHIndex:
+    def __init__(self, dim, n_tables=8, n_planes=12, seed=None):
+        rnd = random.Random(seed)
+        self.dim = dim
+        self.n_planes = n_planes
+        self._planes = [[Vector(rnd.gauss(0, 1) for _ in range(dim))
+                         for _ in range(n_planes)]
+                        for _ in range(n_tables)]
+        self._tables = [{} for _ in range(n_tables)]
+        self._vectors = []
+
+    def __len__(self):
+        return len(self._vectors)
+
+    def __getitem__(self, index):
+        return self._vectors[index]
+
+    def _signatures(self, vector):
+        for planes in self._planes:
+            yield sum(1 << bit for bit, plane in enumerate(planes) if plane @ vector >= 0)
+
+    def _bulk_signatures(self, vectors):
+        planes = numpy.array([[plane._ndarray() for plane in planes]
+                              for planes in self._planes])
+        planes = planes.reshape(len(self._planes), self.n_planes, self.dim)
+        stacked = numpy.array([vector._ndarray() for vector in vectors])
+        bits = numpy.einsum('tpd,nd->ntp', planes, stacked) >= 0
+        weights = 1 << numpy.arange(self.n_planes, dtype=numpy.int64)
+        return (bits @ weights).tolist()
+
+    def _add(self, position, signatures):
+        for table, signature in zip(self._tables, signatures):
+            table.setdefault(signature, []).append(position)
+
+    def insert(self, vector):
+        position = len(self._vectors)
+        self._vectors.append(vector)
+        self._add(position, self._signatures(vector))
+        return position
+
+    def build(self, vectors):
+        vectors = list(vectors)
+        if numpy is None or not vectors:
+            for vector in vectors:
+                self.insert(vector)
+            return
+
+        start = len(self._vectors)
+        self._vectors.extend(vectors)
+        for position, signatures in enumerate(self._bulk_signatures(vectors), start):
+            self._add(position, signatures)
+
+    def candidates(self, query):
+        found = set()
+        for table, signature in zip(self._tables, self._signatures(query)):
+            found.update(table.get(signature, ()))
+        return found
+
+    def query(self, query, k=1, metric='cosine'):
+        positions = sorted(self.candidates(query))
+        vectors = [self._vectors[position] for position in positions]
+        return [(positions[i], score)
+                for i, score in nearest(query, vectors, k, metric)]
+
+    def save(self, path):
+        with VectorWriter(path) as writer:
+            writer.append(Vector([self.dim, len(self._planes), self.n_planes]))
+            for planes in self._planes:
+                writer.extend(planes)
+            writer.extend(self._vectors)
+
+    @classmethod
+    def load(cls, path):
+        with VectorReader(path) as reader:
+            dim, n_tables, n_planes = map(int, reader[0])
+            index = cls(dim, n_tables=0, n_planes=n_planes)
+            records = (Vector(record) for record in reader)
+            next(records)
+            index._planes = [[next(records) for _ in range(n_planes)]
+                             for _ in range(n_tables)]
+            index._tables = [{} for _ in range(n_tables)]
+            index.build(records)
+        return index
+
+
+if __name__ == '__main__':
+    rnd = random.Random(1)
+    vectors = [Vector(rnd.gauss(0, 1) for _ in range(16)) for _ in range(2000)]
+    index = LSHIndex(16, seed=1)
+    index.build(vectors)
+    query = vectors[42]
+    print(index.query(query, k=3))
+    print(nearest(query, vectors, k=3))
@@ -0,0 +1,40 @@
+import random
+import sys
+import time
+
+from vector_v7 import Vector
+from vector_index import LSHIndex
+from vector_search import nearest
+
+DIMENSIONS = 32
+QUERIES = 20
+K = 10
+CONFIGS = ((4, 8), (8, 8), (16, 6), (8, 12), (16, 12))  # (tables, planes per table)
+
+
+def run(size):
+    rnd = random.Random(size)
+    vectors = [Vector(rnd.gauss(0, 1) for _ in range(DIMENSIONS)) for _ in range(size)]
+    queries = [vectors[rnd.randrange(size)] + Vector(rnd.gauss(0, 0.3) for _ in range(DIMENSIONS))
+               for _ in range(QUERIES)]
+
+    t0 = time.perf_counter()
+    expected = [{i for i, _ in nearest(query, vectors, K)} for query in queries]
+    brute = (time.perf_counter() - t0) / QUERIES
+    print('{:>9,} vectors  brute force: {:.2e}s/query'.format(size, brute))
+
+    for n_tables, n_planes in CONFIGS:
+        index = LSHIndex(DIMENSIONS, n_tables, n_planes, seed=size)
+        index.build(vectors)
+        t0 = time.perf_counter()
+        found = [{i for i, _ in index.query(query, K)} for query in queries]
+        latency = (time.perf_counter() - t0) / QUERIES
+        recall = sum(len(f & e) for f, e in zip(found, expected)) / (K * QUERIES)
+        print('    {:>2} tables x {:>2} planes: recall@{} {:.2f}  {:.2e}s/query  ({:.0f}x)'.format(
+            n_tables, n_planes, K, recall, latency, brute / latency))
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10 ** 4]
+    for size in sizes:
+        run(size)
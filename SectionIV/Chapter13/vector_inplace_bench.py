@@ -0,0 +1,43 @@
+import time
+import tracemalloc
+
+from vector_v7 import Vector, MutableVector
+
+DIMENSIONS = 10000
+TERMS = 200
+
+
+def accumulate(acc, inplace, terms):
+    buffers = 0
+    for term in terms:
+        before = acc._components
+        if inplace:
+            acc += term
+        else:
+            acc = acc + term
+        buffers += acc._components is not before
+    return buffers
+
+
+def measure(cls, inplace):
+    terms = [Vector([float(n)] * DIMENSIONS) for n in range(TERMS)]
+
+    t0 = time.perf_counter()
+    buffers = accumulate(cls([0.0] * DIMENSIONS), inplace, terms)
+    elapsed = time.perf_counter() - t0
+
+    acc = cls([0.0] * DIMENSIONS)
+    tracemalloc.start()
+    accumulate(acc, inplace, terms)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return elapsed, buffers, peak
+
+
+if __name__ == '__main__':
+    for label, cls, inplace in (('acc = acc + v', Vector, False),
+                                ('acc += v', MutableVector, True)):
+        elapsed, buffers, peak = measure(cls, inplace)
+        print('{:<14} {:.3f}s  new buffers: {:>4}  peak traced: {:>9,} bytes'.format(
+            label, elapsed, buffers, peak))
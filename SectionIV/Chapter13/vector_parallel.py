@@ -0,0 +1,128 @@
+import contextlib
+import math
+import operator
+import os
+from array import array
+from concurrent import futures
+from multiprocessing import resource_tracker, shared_memory
+
+from vector_v7 import Vector, _checked, _typed, _widened, numpy
+
+PARALLEL_THRESHOLD = 10 ** 6
+
+
+def start_resource_tracker():
+    # Pools forked after this share the parent's tracker; workers forked before
+    # it each spawn their own and "clean up" segments the parent already
+    # unlinked. Call it before creating an executor to pass in.
+    resource_tracker.ensure_running()
+
+
+def _shared_segment(nbytes):
+    start_resource_tracker()
+    return shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+
+
+def _shared_copy(vector):
+    components = memoryview(vector._components)
+    if not components.c_contiguous:
+        components = memoryview(components.tobytes())
+    shm = _shared_segment(components.nbytes)
+    shm.buf[:components.nbytes] = components.cast('B')
+    return shm
+
+
+def _chunks(size, workers):
+    if not size:
+        return []
+    step = -(-size // workers)
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def _sum_squares(name, typecode, start, stop):
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        with shm.buf.cast(typecode) as components, components[start:stop] as chunk:
+            if numpy is not None:
+                values = numpy.asarray(chunk)
+                total = float(numpy.einsum('i,i->', values, values, dtype='d'))
+                del values
+                return total
+            return sum(x * x for x in chunk)
+    finally:
+        shm.close()
+
+
+def _add_chunk(names, typecode, sizes, start, stop):
+    shms = [shared_memory.SharedMemory(name=name) for name in names]
+    try:
+        with contextlib.ExitStack() as stack:
+            a, b, out = (stack.enter_context(shm.buf.cast(typecode)) for shm in shms)
+            longer = a if sizes[0] >= sizes[1] else b
+            # add where both vectors have components, copy the longer one's tail
+            mid = min(max(start, min(sizes)), stop)
+            if numpy is not None and start < mid:
+                # integers add wide and are range-checked, as in serial Vector.__add__
+                values = _checked(numpy.add(_widened(numpy.asarray(a[start:mid])),
+                                            numpy.asarray(b[start:mid])), typecode)
+                out[start:mid] = memoryview(values)
+                del values
+            elif start < mid:
+                out[start:mid] = array(typecode, map(operator.add, a[start:mid], b[start:mid]))
+            out[mid:stop] = longer[mid:stop]
+    finally:
+        for shm in shms:
+            shm.close()
+
+
+def _pool(workers, executor):
+    if executor is not None:
+        return contextlib.nullcontext(executor)
+    return futures.ProcessPoolExecutor(workers)
+
+
+def parallel_abs(vector, workers=None, executor=None, threshold=PARALLEL_THRESHOLD):
+    if len(vector) < threshold:
+        return abs(vector)
+    workers = workers or os.cpu_count()
+
+    shm = _shared_copy(vector)
+    try:
+        with _pool(workers, executor) as pool:
+            jobs = [pool.submit(_sum_squares, shm.name, vector.typecode, start, stop)
+                    for start, stop in _chunks(len(vector), workers)]
+            return math.sqrt(sum(job.result() for job in jobs))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def parallel_add(a, b, workers=None, executor=None, threshold=PARALLEL_THRESHOLD):
+    if (not isinstance(b, Vector) or a.typecode != b.typecode or
+            min(len(a), len(b)) < threshold):
+        return a + b
+
+    workers = workers or os.cpu_count()
+    size = max(len(a), len(b))
+    itemsize = memoryview(a._components).itemsize
+    shms = [_shared_copy(a), _shared_copy(b), _shared_segment(size * itemsize)]
+    try:
+        with _pool(workers, executor) as pool:
+            names = [shm.name for shm in shms]
+            sizes = (len(a), len(b))
+            jobs = [pool.submit(_add_chunk, names, a.typecode, sizes, start, stop)
+                    for start, stop in _chunks(size, workers)]
+            for job in jobs:
+                job.result()
+
+        with shms[2].buf[:size * itemsize] as result:
+            if a.storage == 'numpy':
+                components = numpy.frombuffer(result, dtype=a.typecode).copy()
+            else:
+                components = array(a.typecode)
+                components.frombytes(result)
+        return _typed(a.typecode)._fromstorage(components)
+    finally:
+        for shm in shms:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,29 @@
+import sys
+import time
+from concurrent import futures
+
+from vector_v7 import Vector
+from vector_parallel import parallel_abs, parallel_add, start_resource_tracker
+
+
+def timed(func, *args, **kwargs):
+    t0 = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - t0
+
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 7
+    v = Vector(range(size))
+    w = Vector(range(size))
+
+    start_resource_tracker()
+    print('{:,} components'.format(size))
+    print('serial     abs {:.3f}s  add {:.3f}s'.format(timed(abs, v), timed(lambda: v + w)))
+    for workers in (1, 2, 4, 8):
+        with futures.ProcessPoolExecutor(workers) as pool:
+            pool.submit(abs, v[:1]).result()  # start the workers before timing
+            elapsed_abs = timed(parallel_abs, v, workers, pool, threshold=0)
+            elapsed_add = timed(parallel_add, v, w, workers, pool, threshold=0)
+        print('{} worker{:<3} abs {:.3f}s  add {:.3f}s'.format(
+            workers, 's' if workers > 1 else '', elapsed_abs, elapsed_add))
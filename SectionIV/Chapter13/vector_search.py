@@ -0,0 +1,44 @@
+import heapq
+import itertools
+import math
+
+from vector_v7 import Vector
+
+
+def _cosine_scores(query, vectors):
+    query_norm = abs(query)
+    if not query_norm:
+        return
+    for i, v in enumerate(vectors):
+        norm = abs(v)
+        if norm:  # skip the nan cosines of zero vectors, which cannot be ranked
+            yield i, (query @ v) / (query_norm * norm)
+
+
+def _distance(a, b):
+    # missing components count as zero, as they do for @ and cosine
+    if len(a) < len(b):
+        a, b = b, a
+    if len(a) > len(b):
+        b = itertools.chain(b, itertools.repeat(0, len(a) - len(b)))
+    return math.dist(a, tuple(b))
+
+
+def nearest(query, vectors, k=1, metric='cosine'):
+    if metric == 'cosine':
+        return heapq.nlargest(k, _cosine_scores(query, vectors), key=lambda pair: pair[1])
+    elif metric == 'dot':
+        scores = ((i, query @ v) for i, v in enumerate(vectors))
+        return heapq.nlargest(k, scores, key=lambda pair: pair[1])
+    elif metric == 'euclidean':
+        scores = ((i, _distance(query, v)) for i, v in enumerate(vectors))
+        return heapq.nsmallest(k, scores, key=lambda pair: pair[1])
+    else:
+        raise ValueError('unknown metric {!r}'.format(metric))
+
+if __name__ == '__main__':
+    vectors = [Vector([1, 0]), Vector([0, 1]), Vector([1, 1]), Vector([-1, 0])]
+    query = Vector([2, 1])
+    print(query @ vectors[2], query.cosine(vectors[2]))
+    for metric in ('cosine', 'dot', 'euclidean'):
+        print(metric, nearest(query, vectors, k=2, metric=metric))
@@ -2,29 +2,178 @@ import itertools
 from array import array
 import reprlib
 import math
+import mmap
 import functools
 import operator
 import numbers
+import collections.abc
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_UNSIGNED_CODES = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+_CHUNK_SIZE = 4096
+
+
+class _Shortcut:
+    __slots__ = ('pos', 'name')
+
+    def __init__(self, pos):
+        self.pos = pos
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        components = instance._components
+        if self.pos < len(components):
+            if type(components) is array:
+                return components[self.pos]
+            return instance[self.pos]
+
+        msg = '{.__name__!r} object has no attribute {!r}'
+        raise AttributeError(msg.format(owner, self.name))
+
+    def __set__(self, instance, value):
+        raise AttributeError('readonly attribute {!r}'.format(self.name))
 
 
 class Vector:
+    __slots__ = ('_components', '_angle_tails', '__weakref__')
+
     typecode = 'd'
     shortcut_names = 'xyzt'
+    x = _Shortcut(0)
+    y = _Shortcut(1)
+    z = _Shortcut(2)
+    t = _Shortcut(3)
+    default_storage = 'array'
+    slice_views = False
+    bitwise_eq = False
+
+    def __init__(self, components, storage=None):
+        if storage is None:
+            storage = self.default_storage
+        if storage not in ('array', 'numpy'):
+            raise ValueError('unknown storage {!r}'.format(storage))
 
-    def __init__(self, components):
-        self._components = array(self.typecode, components)
+        if isinstance(components, Vector):
+            components = components._components
+        if storage == 'numpy' and numpy is not None:
+            self._components = _numpy_array(self.typecode, components)
+        else:
+            self._components = array(self.typecode, components)
+
+    @classmethod
+    def _fromstorage(cls, components):
+        vector = cls.__new__(cls)
+        vector._components = components
+        return vector
+
+    @property
+    def storage(self):
+        if numpy is not None and isinstance(self._components, numpy.ndarray):
+            return 'numpy'
+        return 'array'
+
+    def _ndarray(self):
+        return numpy.asarray(self._components, dtype=self.typecode)
+
+    def _uses_numpy(self, other):
+        return (self.storage == 'numpy' or
+                isinstance(other, Vector) and other.storage == 'numpy')
 
     def __iter__(self):
+        if self.storage == 'numpy':
+            components = self._components
+            chunks = (components[start:start + _CHUNK_SIZE].tolist()
+                      for start in range(0, len(components), _CHUNK_SIZE))
+            return itertools.chain.from_iterable(chunks)
         return iter(self._components)
 
     def __repr__(self):
-        components = reprlib.repr(self._components)
+        components = self._components
+        if not isinstance(components, array):
+            components = array(self.typecode, components[:6])
+        components = reprlib.repr(components)
         components = components[components.find('['):-1]
-        return 'Vector({})'.format(components)
+        return '{}({})'.format(type(self).__name__, components)
 
     def __str__(self):
         return str(tuple(self))
 
+    def _formatted(self, fmt_spec):
+        if fmt_spec.endswith('h'):  # hyperspherical coordinates
+            fmt_spec = fmt_spec[:-1]
+            coords = itertools.chain([abs(self)], self.angles())
+            brackets = '<>'
+        else:
+            coords = self
+            brackets = '()'
+        return brackets, (format(c, fmt_spec) for c in coords)
+
+    def __format__(self, fmt_spec=''):
+        brackets, components = self._formatted(fmt_spec)
+        return brackets[0] + ', '.join(components) + brackets[1]
+
+    def write_formatted(self, stream, fmt_spec='', sep=', ', enclose=True):
+        brackets, components = self._formatted(fmt_spec)
+        if enclose:
+            stream.write(brackets[0])
+        chunk = list(itertools.islice(components, _CHUNK_SIZE))
+        while chunk:
+            stream.write(sep.join(chunk))
+            chunk = list(itertools.islice(components, _CHUNK_SIZE))
+            if chunk:
+                stream.write(sep)
+        if enclose:
+            stream.write(brackets[1])
+
+    def _tails(self):
+        try:
+            return self._angle_tails
+        except AttributeError:
+            pass
+
+        components = self._components
+        if self.storage == 'numpy':
+            tails = numpy.cumsum(numpy.square(components, dtype='d')[::-1])[::-1]
+        else:
+            tails = array('d', itertools.accumulate(x * x for x in reversed(components)))
+            tails.reverse()
+        if self._owns_components():
+            self._angle_tails = tails
+        return tails
+
+    def _owns_components(self):
+        # views and mapped files share a buffer that may change under them
+        components = self._components
+        if self.storage == 'numpy':
+            return components.base is None
+        return isinstance(components, array)
+
+    def _angle(self, n, tails):
+        r = math.sqrt(tails[n])
+        a = math.atan2(r, self[n - 1])
+        if (n == len(self) - 1) and (self[-1] < 0):
+            return math.pi * 2 - a
+        else:
+            return a
+
+    def angle(self, n):
+        if not 1 <= n < len(self):
+            raise IndexError('angle index out of range')
+        return self._angle(n, self._tails())
+
+    def angles(self):
+        # one tail pass per call, even for buffers whose tails are not cached
+        tails = self._tails()
+        return (self._angle(n, tails) for n in range(1, len(self)))
+
     def __bytes__(self):
         return (bytes([ord(self.typecode)]) +
                 bytes(self._components))
@@ -36,12 +185,26 @@ class Vector:
         else:
             return not eq_result
 
+    def _buffer(self):
+        memv = memoryview(self._components)
+        if not self.bitwise_eq:
+            return memv
+        code = _UNSIGNED_CODES[memv.itemsize]
+        if not memv.c_contiguous:
+            memv = memoryview(memv.tobytes())
+        return memv.cast('B').cast(code)
+
     def __eq__(self, other):
-        if isinstance(other, Vector):
-            return len(self) == len(other) and \
-                   all(a == b for a, b in zip(self, other))
-        else:
+        if not isinstance(other, Vector):
             return NotImplemented
+        elif len(self) != len(other):
+            return False
+        elif self.typecode == other.typecode:
+            return self._buffer() == other._buffer()
+        elif self._uses_numpy(other):
+            return bool(numpy.array_equal(self._ndarray(), other._ndarray()))
+        else:
+            return all(a == b for a, b in zip(self, other))
 
     def __hash__(self):
         hashes = map(hash, self._components)
@@ -55,52 +218,63 @@ class Vector:
 
     def __getitem__(self, index):
         cls = type(self)
-        if isinstance(index, slice):
-            return cls(self._components[index])
+        if isinstance(index, slice) and self.slice_views:
+            return self.view(index)
+        elif isinstance(index, slice):
+            components = self._components[index]
+            if isinstance(components, array):
+                return cls._fromstorage(components)
+            return cls(components, storage=self.storage)
         elif isinstance(index, numbers.Integral):
+            if self.storage == 'numpy':
+                return self._components[index].item()
             return self._components[index]
         else:
             msg = '{cls.__name__} indices must be integers'
             raise TypeError(msg.format(cls=cls))
 
-    def __getattr__(self, name):
-        cls = type(self)
-        if len(name) == 1:
-            pos = cls.shortcut_names.find(name)
-            if 0 <= pos < len(self._components):
-                return self._components[pos]
-
-        msg = '{.__name__!r} object has no attribute {!r}'
-        raise AttributeError(msg.format(cls, name))
-
-    def __setattr__(self, name, value):
-        cls = type(self)
-        if len(name) == 1:
-            if name in cls.shortcut_names:
-                error = 'readonly attribute {attr_name!r}'
-            elif name.islower():
-                error = "can't set attributes 'a' to 'z' in {cls_name!r}"
-            else:
-                error = ''
-            if error:
-                msg = error.format(cls_name=cls.__name__, attr_name=name)
-                raise AttributeError(msg)
-
-        super().__setattr__(name, value)
+    def view(self, index):
+        if not isinstance(index, slice):
+            msg = '{cls.__name__} views need a slice, not {index!r}'
+            raise TypeError(msg.format(cls=type(self), index=index))
+        if self.storage == 'numpy':
+            components = self._components[index]
+            components.flags.writeable = False
+        else:
+            components = memoryview(self._components).toreadonly()[index]
+        return type(self)._fromstorage(components)
 
     def __abs__(self):
+        if self.storage == 'numpy':
+            components = self._components
+            return math.sqrt(float(numpy.einsum('i,i->', components, components, dtype='d')))
         return math.sqrt(sum(x * x for x in self))
 
     def __neg__(self):
-        return Vector(-x for x in self)
+        cls = _typed(self.typecode)
+        if self.storage == 'numpy':
+            return cls._fromstorage(_checked(-_widened(self._components), cls.typecode))
+        return cls(-x for x in self)
 
     def __pos__(self):
-        return Vector(self)
+        return _typed(self.typecode)(self, storage=self.storage)
 
     def __add__(self, other):
+        if isinstance(other, Vector):
+            cls = _typed(_promote(self.typecode, other.typecode))
+        else:
+            cls = _typed(_promote_float(self.typecode))
+
+        if isinstance(other, Vector) and self._uses_numpy(other):
+            longer, shorter = self._ndarray(), other._ndarray()
+            if len(longer) < len(shorter):
+                longer, shorter = shorter, longer
+            result = longer.astype(_wide_typecode(cls.typecode))
+            result[:len(shorter)] += shorter
+            return cls._fromstorage(_checked(result, cls.typecode))
         try:
-            pairs = itertools.zip_longest(self, other, fillvalue=0.0)
-            return Vector(a + b for a, b in pairs)
+            pairs = itertools.zip_longest(self, other, fillvalue=0)
+            return cls(a + b for a, b in pairs)
         except TypeError:
             return NotImplemented
 
@@ -108,16 +282,268 @@ class Vector:
         return self + other
 
     def __mul__(self, scalar):
-        if isinstance(scalar, numbers.Real):
-            return Vector(n * scalar for n in self)
-        else:
+        if not isinstance(scalar, numbers.Real):
             return NotImplemented
+        elif isinstance(scalar, numbers.Integral):
+            cls = _typed(self.typecode)
+        else:
+            cls = _typed(_promote_float(self.typecode))
+
+        if self.storage == 'numpy':
+            components = _widened(self._components)
+            if components.dtype.kind == 'i' and abs(scalar) >= 2 ** 32:
+                components = components.astype(object)
+            return cls._fromstorage(_checked(components * scalar, cls.typecode))
+        return cls(n * scalar for n in self)
 
     def __rmod__(self, scalar):
         return self * scalar
 
+    def __matmul__(self, other):
+        if isinstance(other, Vector) and self._uses_numpy(other):
+            size = min(len(self), len(other))
+            return float(numpy.einsum('i,i->', self._ndarray()[:size],
+                                      other._ndarray()[:size], dtype='d'))
+        elif isinstance(other, Vector):
+            return sum(map(operator.mul, self._components, other._components))
+        elif _has_own_dot(other):
+            return NotImplemented
+        try:
+            return sum(map(operator.mul, self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __rmatmul__(self, other):
+        return self @ other
+
+    def cosine(self, other):
+        # a zero vector has no direction, so its cosine with anything is nan
+        norms = abs(self) * abs(other)
+        return (self @ other) / norms if norms else math.nan
+
     @classmethod
     def frombytes(cls, octets):
         typecode = chr(octets[0])
-        memv = memoryview(octets[1:]).cast(typecode)
+        memv = memoryview(octets)[1:].cast(typecode)
+        if cls is Vector:
+            cls = _typed(typecode)
         return cls(memv)
+
+    @classmethod
+    def open_mmap(cls, path, storage=None):
+        if storage is None:
+            storage = cls.default_storage
+        with open(path, 'rb') as fp:
+            mapped = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        typecode = chr(mapped[0])
+        if cls is Vector:
+            cls = _typed(typecode)
+        if typecode != cls.typecode:
+            msg = '{!r} holds typecode {!r}, expected {!r}'
+            raise ValueError(msg.format(path, typecode, cls.typecode))
+
+        if storage == 'numpy' and numpy is not None:
+            components = numpy.frombuffer(mapped, dtype=typecode, offset=1)
+        else:
+            components = memoryview(mapped)[1:].cast(typecode)
+        return cls._fromstorage(components)
+
+    def save(self, path):
+        components = memoryview(self._components)
+        if not components.c_contiguous:
+            components = components.tobytes()
+        with open(path, 'wb') as fp:
+            fp.write(bytes([ord(self.typecode)]))
+            fp.write(components)
+
+
+class FrozenVector(Vector):
+    __slots__ = ('_hash', '_norm')
+
+    def __init__(self, components, storage=None):
+        super().__init__(components, storage)
+        if self.storage == 'numpy':
+            self._components.flags.writeable = False
+
+    def __hash__(self):
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = super().__hash__()
+            return self._hash
+
+    def __abs__(self):
+        try:
+            return self._norm
+        except AttributeError:
+            self._norm = super().__abs__()
+            return self._norm
+
+
+class MutableVector(Vector):
+    __slots__ = ()
+    __hash__ = None
+
+    def _forget_angles(self):
+        try:
+            del self._angle_tails
+        except AttributeError:
+            pass
+
+    def _inplace(self, other, op):
+        # all the arithmetic and any resizing happen before the first component
+        # is written, so a failed update leaves the vector as it was
+        typecode = self.typecode
+        components = self._components
+        if self.storage == 'numpy':
+            other = other._ndarray() if isinstance(other, Vector) else list(other)
+            other = numpy.asarray(other) if len(other) else numpy.empty(0, typecode)
+            if not numpy.can_cast(other.dtype, components.dtype, 'same_kind'):
+                msg = "can't update {!r} components in place with {} values"
+                raise TypeError(msg.format(typecode, other.dtype))
+            size = len(components)
+            tail = _checked(op(numpy.zeros(max(len(other) - size, 0), _wide_typecode(typecode)),
+                               other[size:]), typecode)
+            overlap = len(other) - len(tail)
+            if typecode in 'hi':  # integer results may overflow
+                components[:overlap] = _checked(op(_widened(components[:overlap]),
+                                                   other[:overlap]), typecode)
+            else:
+                components[:overlap] = op(components[:overlap], other[:overlap])
+            if len(tail):
+                self._components = numpy.concatenate((components, tail))
+        else:
+            values = other._components if isinstance(other, Vector) else other
+            if not (isinstance(values, array) and values.typecode == typecode):
+                values = array(typecode, values)
+            size = len(components)
+            tail = array(typecode, map(op, itertools.repeat(0), values[size:]))
+            overlap = len(values) - len(tail)
+            head = None
+            if typecode in 'hi':  # integer results may overflow
+                head = array(typecode, map(op, components, values))
+            if tail:
+                components.extend(tail)  # BufferError while views are exported
+            if head is not None:
+                components[:overlap] = head
+            else:
+                for start in range(0, overlap, _CHUNK_SIZE):
+                    stop = min(start + _CHUNK_SIZE, overlap)
+                    components[start:stop] = array(typecode, map(op, components[start:stop],
+                                                                 values[start:stop]))
+        self._forget_angles()
+        return self
+
+    def __iadd__(self, other):
+        try:
+            return self._inplace(other, operator.add)
+        except TypeError:
+            return NotImplemented
+
+    def __isub__(self, other):
+        try:
+            return self._inplace(other, operator.sub)
+        except TypeError:
+            return NotImplemented
+
+    def __imul__(self, scalar):
+        if not isinstance(scalar, numbers.Real):
+            return NotImplemented
+        elif _promote_float(self.typecode) != self.typecode and \
+                not isinstance(scalar, numbers.Integral):
+            return NotImplemented
+        components = self._components
+        if self.typecode in 'hi':  # check for overflow before writing anything
+            components[:] = Vector.__mul__(self, scalar)._components
+        elif self.storage == 'numpy':
+            components *= scalar
+        else:
+            for start in range(0, len(components), _CHUNK_SIZE):
+                stop = start + _CHUNK_SIZE
+                components[start:stop] = array(self.typecode, map(operator.mul, components[start:stop],
+                                                                  itertools.repeat(scalar)))
+        self._forget_angles()
+        return self
+
+
+class FloatVector(Vector):
+    __slots__ = ()
+    typecode = 'f'
+
+
+class IntVector(Vector):
+    __slots__ = ()
+    typecode = 'i'
+
+
+class ShortVector(Vector):
+    __slots__ = ()
+    typecode = 'h'
+
+
+_TYPED = {cls.typecode: cls for cls in (Vector, FloatVector, IntVector, ShortVector)}
+
+
+def _typed(typecode):
+    return _TYPED.get(typecode, Vector)
+
+
+# Promotion rules for binary operators:
+# - two vectors with the same typecode give that typecode;
+# - mixing 'h' and 'i' gives 'i', any other mix gives 'd';
+# - plain iterables and non-integral scalars count as Python floats, so they
+#   keep 'f' and 'd' and promote 'h' and 'i' to 'd'.
+# Integer results are never wrapped around: a component that does not fit the
+# result typecode raises OverflowError with either storage.
+def _promote(typecode, other_typecode):
+    if typecode == other_typecode:
+        return typecode
+    elif typecode in 'hi' and other_typecode in 'hi':
+        return 'i'
+    else:
+        return 'd'
+
+
+def _promote_float(typecode):
+    return typecode if typecode in 'fd' else 'd'
+
+
+def _wide_typecode(typecode):
+    return 'q' if typecode in 'hi' else typecode
+
+
+def _widened(components):
+    return components.astype(_wide_typecode(components.dtype.char))
+
+
+def _checked(values, typecode):
+    if typecode in 'hi' and values.size:
+        info = numpy.iinfo(typecode)
+        if values.min() < info.min or values.max() > info.max:
+            msg = 'component out of range for typecode {!r}'
+            raise OverflowError(msg.format(typecode))
+    return values.astype(typecode)
+
+
+def _has_own_dot(other):
+    # operands such as SparseVector take dense @ other through their __rmatmul__
+    if isinstance(other, collections.abc.Sequence):
+        return False
+    elif numpy is not None and isinstance(other, numpy.ndarray):
+        return False
+    return hasattr(type(other), '__rmatmul__')
+
+
+def _numpy_array(typecode, components):
+    # integer typecodes reject floats and out-of-range values like array() does
+    if isinstance(components, (array, memoryview, numpy.ndarray)):
+        values = numpy.asarray(components)
+        if typecode not in 'hi':
+            return numpy.array(values, dtype=typecode)
+        elif values.size and not numpy.can_cast(values.dtype, typecode, 'same_kind'):
+            msg = 'typecode {!r} needs integer components, got {}'
+            raise TypeError(msg.format(typecode, values.dtype))
+        return _checked(values, typecode)
+    elif typecode in 'hi':
+        return numpy.array(array(typecode, components), dtype=typecode)
+    return numpy.fromiter(components, dtype=typecode)
@@ -0,0 +1,145 @@
+from array import array
+import itertools
+import math
+import numbers
+import operator
+
+from vector2d_v3_slots import Vector2d
+
+
+class Vector2dView:  # a read-only row of a Vector2dArray, not a copy
+    __slots__ = ('_points', '_index')
+
+    typecode = Vector2d.typecode
+
+    def __init__(self, points, index):
+        self._points = points
+        self._index = index
+
+    @property
+    def x(self):
+        return self._points._xs[self._index]
+
+    @property
+    def y(self):
+        return self._points._ys[self._index]
+
+    def topoint(self):
+        return Vector2d(self.x, self.y)
+
+    angle = Vector2d.angle
+    __iter__ = Vector2d.__iter__
+    __repr__ = Vector2d.__repr__
+    __str__ = Vector2d.__str__
+    __bytes__ = Vector2d.__bytes__
+    __eq__ = Vector2d.__eq__
+    __hash__ = Vector2d.__hash__
+    __abs__ = Vector2d.__abs__
+    __bool__ = Vector2d.__bool__
+    __format__ = Vector2d.__format__
+
+
+class Vector2dArray:
+    typecode = 'd'
+
+    def __init__(self, points=()):
+        self._xs = array(self.typecode)
+        self._ys = array(self.typecode)
+        self.extend(points)
+
+    @classmethod
+    def _fromcolumns(cls, xs, ys):
+        points = cls()
+        points._xs = xs
+        points._ys = ys
+        return points
+
+    def append(self, point):
+        x, y = point
+        self._xs.append(x)
+        self._ys.append(y)
+
+    def extend(self, points):
+        if isinstance(points, Vector2dArray):
+            self._xs.extend(points._xs)
+            self._ys.extend(points._ys)
+            return
+        for point in points:
+            self.append(point)
+
+    def __len__(self):
+        return len(self._xs)
+
+    def __iter__(self):
+        return map(Vector2dView, itertools.repeat(self), range(len(self)))
+
+    def __getitem__(self, index):
+        cls = type(self)
+        if isinstance(index, slice):
+            return cls._fromcolumns(self._xs[index], self._ys[index])
+        elif isinstance(index, numbers.Integral):
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError('{} index out of range'.format(cls.__name__))
+            return Vector2dView(self, index)
+        else:
+            msg = '{cls.__name__} indices must be integers'
+            raise TypeError(msg.format(cls=cls))
+
+    def __repr__(self):
+        return '{}(<{} points>)'.format(type(self).__name__, len(self))
+
+    def __eq__(self, other):
+        if isinstance(other, Vector2dArray):
+            return self._xs == other._xs and self._ys == other._ys
+        return NotImplemented
+
+    def __abs__(self):
+        return array(self.typecode, map(math.hypot, self._xs, self._ys))
+
+    def angles(self):
+        return array(self.typecode, map(math.atan2, self._ys, self._xs))
+
+    def hashes(self):
+        return array('q', map(operator.xor, map(hash, self._xs), map(hash, self._ys)))
+
+    def __format__(self, fmt_spec=''):
+        if fmt_spec.endswith('p'):
+            fmt_spec = fmt_spec[:-1]
+            coords = zip(abs(self), self.angles())
+            outer_fmt = '<{}, {}>'
+        else:
+            coords = zip(self._xs, self._ys)
+            outer_fmt = '({}, {})'
+
+        points = (outer_fmt.format(format(a, fmt_spec), format(b, fmt_spec))
+                  for a, b in coords)
+        return '[{}]'.format(', '.join(points))
+
+    def __bytes__(self):
+        interleaved = array(self.typecode, bytes(2 * len(self) * self._xs.itemsize))
+        memv = memoryview(interleaved)
+        memv[0::2] = memoryview(self._xs)
+        memv[1::2] = memoryview(self._ys)
+        return bytes([ord(self.typecode)]) + bytes(interleaved)
+
+    @classmethod
+    def frombytes(cls, octets):
+        typecode = chr(octets[0])
+        memv = memoryview(octets)[1:].cast(typecode)
+        xs = array(typecode, memv[0::2].tobytes())
+        ys = array(typecode, memv[1::2].tobytes())
+        if typecode != cls.typecode:
+            xs, ys = array(cls.typecode, xs), array(cls.typecode, ys)
+        return cls._fromcolumns(xs, ys)
+
+
+if __name__ == '__main__':
+    points = Vector2dArray([(3, 4), (1, 1), Vector2d(0, -2)])
+    print(points, len(points), points[0], points[1:])
+    print(abs(points), points.angles())
+    print(list(points.hashes()), [hash(p) for p in points])
+    print(format(points, '.2f'), format(points, '.3ep'))
+    print(bytes(points[:1]) == bytes(Vector2d(3, 4)))
+    print(Vector2dArray.frombytes(bytes(points)) == points)
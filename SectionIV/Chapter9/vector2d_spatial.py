@@ -0,0 +1,262 @@
+import heapq
+import itertools
+import math
+import operator
+
+from vector2d_v3_slots import Vector2d
+
+
+def _coords(point):
+    x, y = point
+    return float(x), float(y)
+
+
+class GridIndex:
+    def __init__(self, cell_size=1.0, points=()):
+        if cell_size <= 0:
+            raise ValueError('cell_size must be positive')
+        self.cell_size = cell_size
+        self._cells = {}
+        self._size = 0
+        for point in points:
+            self.insert(point)
+
+    def _cell(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return (point for cell in self._cells.values() for _, _, point in cell)
+
+    def insert(self, point):
+        x, y = _coords(point)
+        self._cells.setdefault(self._cell(x, y), []).append((x, y, point))
+        self._size += 1
+
+    def remove(self, point):
+        x, y = _coords(point)
+        key = self._cell(x, y)
+        cell = self._cells.get(key, ())
+        for i, (px, py, _) in enumerate(cell):
+            if px == x and py == y:
+                del cell[i]
+                if not cell:
+                    del self._cells[key]
+                self._size -= 1
+                return
+        raise ValueError('{!r} not in index'.format(point))
+
+    def within(self, center, radius):
+        x, y = _coords(center)
+        left, bottom = self._cell(x - radius, y - radius)
+        right, top = self._cell(x + radius, y + radius)
+        found = []
+        cells = self._cells
+        if (right - left + 1) * (top - bottom + 1) > len(cells):
+            keys = [key for key in cells
+                    if left <= key[0] <= right and bottom <= key[1] <= top]
+        else:
+            keys = itertools.product(range(left, right + 1), range(bottom, top + 1))
+        for key in keys:
+            for px, py, point in cells.get(key, ()):
+                if math.hypot(px - x, py - y) <= radius:
+                    found.append(point)
+        return found
+
+    def _ring(self, cx, cy, ring):
+        if ring == 0:
+            yield cx, cy
+            return
+        for i in range(-ring, ring + 1):
+            yield cx + i, cy - ring
+            yield cx + i, cy + ring
+        for j in range(-ring + 1, ring):
+            yield cx - ring, cy + j
+            yield cx + ring, cy + j
+
+    def nearest(self, query, k=1):
+        if k <= 0:
+            return []
+        x, y = _coords(query)
+        cx, cy = self._cell(x, y)
+        best = []  # max-heap of (-distance, tiebreak, point)
+        counter = itertools.count()
+
+        def consider(cell):
+            for px, py, point in cell:
+                item = (-math.hypot(px - x, py - y), next(counter), point)
+                if len(best) < k:
+                    heapq.heappush(best, item)
+                elif item > best[0]:
+                    heapq.heapreplace(best, item)
+
+        seen = probed = 0
+        for ring in itertools.count():
+            if seen == self._size:
+                break
+            # every point outside the rings visited so far is at least this far away
+            if len(best) == k and -best[0][0] <= ring * self.cell_size - self.cell_size:
+                break
+            ring_cells = 8 * ring or 1
+            if probed + ring_cells > len(self._cells):
+                # probing empty space costs more than visiting the rest directly
+                for (kx, ky), cell in self._cells.items():
+                    if max(abs(kx - cx), abs(ky - cy)) >= ring:
+                        consider(cell)
+                break
+            probed += ring_cells
+            for key in self._ring(cx, cy, ring):
+                cell = self._cells.get(key, ())
+                seen += len(cell)
+                consider(cell)
+        return [(-neg, point) for neg, _, point in sorted(best, reverse=True)]
+
+
+class _Node:
+    __slots__ = ('x', 'y', 'point', 'left', 'right', 'deleted')
+
+    def __init__(self, x, y, point):
+        self.x = x
+        self.y = y
+        self.point = point
+        self.left = None
+        self.right = None
+        self.deleted = False
+
+
+class KDTree:
+    def __init__(self, points=()):
+        self._root = None
+        self._size = 0
+        self._deleted = 0
+        items = [_coords(point) + (point,) for point in points]
+        self._root = self._build(items, 0)
+        self._size = len(items)
+
+    @classmethod
+    def _build(cls, items, depth):
+        if not items:
+            return None
+        axis = depth % 2
+        items.sort(key=operator.itemgetter(axis))
+        mid = len(items) // 2
+        node = _Node(*items[mid])
+        node.left = cls._build(items[:mid], depth + 1)
+        node.right = cls._build(items[mid + 1:], depth + 1)
+        return node
+
+    def __len__(self):
+        return self._size
+
+    def _nodes(self):
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            if not node.deleted:
+                yield node
+            stack.extend(child for child in (node.left, node.right) if child)
+
+    def __iter__(self):
+        return (node.point for node in self._nodes())
+
+    def insert(self, point):
+        x, y = _coords(point)
+        new = _Node(x, y, point)
+        self._size += 1
+        if self._root is None:
+            self._root = new
+            return
+        node, depth = self._root, 0
+        while True:
+            side = 'left' if (x, y)[depth % 2] < (node.x, node.y)[depth % 2] else 'right'
+            child = getattr(node, side)
+            if child is None:
+                setattr(node, side, new)
+                return
+            node, depth = child, depth + 1
+
+    def remove(self, point):
+        x, y = _coords(point)
+        # items equal to a split value may sit on either side of it
+        stack = [(self._root, 0)] if self._root else []
+        while stack:
+            node, depth = stack.pop()
+            if not node.deleted and node.x == x and node.y == y:
+                node.deleted = True
+                self._size -= 1
+                self._deleted += 1
+                if self._deleted > self._size:
+                    self.rebuild()
+                return
+            diff = (x, y)[depth % 2] - (node.x, node.y)[depth % 2]
+            if node.left and diff <= 0:
+                stack.append((node.left, depth + 1))
+            if node.right and diff >= 0:
+                stack.append((node.right, depth + 1))
+        raise ValueError('{!r} not in index'.format(point))
+
+    def rebuild(self):
+        items = [(node.x, node.y, node.point) for node in self._nodes()]
+        self._root = self._build(items, 0)
+        self._deleted = 0
+
+    def within(self, center, radius):
+        x, y = _coords(center)
+        found = []
+        stack = [(self._root, 0)] if self._root else []
+        while stack:
+            node, depth = stack.pop()
+            if not node.deleted and math.hypot(node.x - x, node.y - y) <= radius:
+                found.append(node.point)
+            diff = (x, y)[depth % 2] - (node.x, node.y)[depth % 2]
+            if node.left and diff - radius <= 0:
+                stack.append((node.left, depth + 1))
+            if node.right and diff + radius >= 0:
+                stack.append((node.right, depth + 1))
+        return found
+
+    def nearest(self, query, k=1):
+        if k <= 0:
+            return []
+        x, y = _coords(query)
+        best = []  # max-heap of (-distance, tiebreak, point)
+        counter = itertools.count()
+
+        # stack entries carry the distance from the query to their splitting line
+        stack = [(self._root, 0, 0.0)] if self._root else []
+        while stack:
+            node, depth, bound = stack.pop()
+            if len(best) == k and bound > -best[0][0]:
+                continue
+            if not node.deleted:
+                item = (-math.hypot(node.x - x, node.y - y), next(counter), node.point)
+                if len(best) < k:
+                    heapq.heappush(best, item)
+                elif item > best[0]:
+                    heapq.heapreplace(best, item)
+            diff = (x, y)[depth % 2] - (node.x, node.y)[depth % 2]
+            near, far = (node.left, node.right) if diff < 0 else (node.right, node.left)
+            if far:
+                stack.append((far, depth + 1, abs(diff)))
+            if near:
+                stack.append((near, depth + 1, bound))
+        return [(-neg, point) for neg, _, point in sorted(best, reverse=True)]
+
+
+if __name__ == '__main__':
+    import random
+
+    rnd = random.Random(0)
+    points = [Vector2d(rnd.uniform(-10, 10), rnd.uniform(-10, 10)) for _ in range(1000)]
+    grid = GridIndex(1.0, points)
+    tree = KDTree(points)
+    query = Vector2d(0, 0)
+    print(len(grid.within(query, 2)), len(tree.within(query, 2)))
+    print(grid.nearest(query, 3))
+    print(tree.nearest(query, 3))
+    for point in points[:600]:
+        grid.remove(point)
+        tree.remove(point)
+    print(len(grid), len(tree), grid.nearest(query) == tree.nearest(query))
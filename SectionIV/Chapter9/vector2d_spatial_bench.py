@@ -0,0 +1,58 @@
+import heapq
+import math
+import random
+import sys
+import time
+
+from vector2d_v3_slots import Vector2d
+from vector2d_spatial import GridIndex, KDTree
+
+QUERIES = 50
+K = 10
+RADIUS = 0.01  # the unit square holds the points; this is about 3 per 10**4
+
+
+def linear_within(points, center, radius):
+    return [p for p in points if math.hypot(p.x - center.x, p.y - center.y) <= radius]
+
+
+def linear_nearest(points, query, k):
+    return heapq.nsmallest(k, points, key=lambda p: math.hypot(p.x - query.x, p.y - query.y))
+
+
+def timed(fn, queries):
+    t0 = time.perf_counter()
+    results = [fn(query) for query in queries]
+    return (time.perf_counter() - t0) / len(queries), results
+
+
+def run(size):
+    rnd = random.Random(size)
+    points = [Vector2d(rnd.random(), rnd.random()) for _ in range(size)]
+    queries = [Vector2d(rnd.random(), rnd.random()) for _ in range(QUERIES)]
+    print('{:>9,} points'.format(size))
+
+    t0 = time.perf_counter()
+    grid = GridIndex(1 / math.sqrt(size), points)
+    print('    grid build:     {:.3f}s'.format(time.perf_counter() - t0))
+    t0 = time.perf_counter()
+    tree = KDTree(points)
+    print('    k-d tree build: {:.3f}s'.format(time.perf_counter() - t0))
+
+    scan_range, expected = timed(lambda q: linear_within(points, q, RADIUS), queries)
+    scan_knn, _ = timed(lambda q: linear_nearest(points, q, K), queries)
+    print('    linear scan: range {:.2e}s/query  {}-NN {:.2e}s/query'.format(
+        scan_range, K, scan_knn))
+
+    for name, index in (('grid', grid), ('k-d tree', tree)):
+        range_time, found = timed(lambda q: index.within(q, RADIUS), queries)
+        knn_time, _ = timed(lambda q: index.nearest(q, K), queries)
+        assert [len(f) for f in found] == [len(e) for e in expected]
+        print('    {:>8}: range {:.2e}s/query ({:.0f}x)  {}-NN {:.2e}s/query ({:.0f}x)'.format(
+            name, range_time, scan_range / range_time, K, knn_time, scan_knn / knn_time))
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10 ** n for n in range(3, 7)]
+    for size in sizes:
+        run(size)
@@ -0,0 +1,110 @@
+from array import array
+
+from vector2d_array import Vector2dArray
+from vector2d_v3_slots import Vector2d
+
+CHUNK_RECORDS = 65536
+
+
+def record_size(typecode):
+    return 1 + 2 * array(typecode).itemsize
+
+
+def decode_points(octets):
+    memv = memoryview(octets).cast('B')
+    if not memv:
+        return Vector2dArray()
+    typecode = chr(memv[0])
+    size = record_size(typecode)
+    if len(memv) % size:
+        raise ValueError('stream length is not a multiple of {} bytes'.format(size))
+    if bytes(memv[::size]).strip(typecode.encode()):
+        raise ValueError('stream mixes typecodes')
+
+    payload = bytearray(memv)
+    del payload[::size]
+    coords = array(typecode)
+    coords.frombytes(payload)
+    xs, ys = coords[0::2], coords[1::2]
+    if typecode != Vector2dArray.typecode:
+        xs, ys = array(Vector2dArray.typecode, xs), array(Vector2dArray.typecode, ys)
+    return Vector2dArray._fromcolumns(xs, ys)
+
+
+def iter_points(octets):
+    return iter(decode_points(octets))
+
+
+def encode_points(points):
+    if not isinstance(points, Vector2dArray):
+        points = Vector2dArray(points)
+    typecode = points.typecode
+    size = record_size(typecode)
+    payload = bytes(points)[1:]
+    width = size - 1
+
+    out = bytearray(len(points) * size)
+    out[::size] = typecode.encode() * len(points)
+    for offset in range(width):
+        out[offset + 1::size] = payload[offset::width]
+    return bytes(out)
+
+
+def read_points(fp, chunk_records=CHUNK_RECORDS):
+    pending = bytearray()  # short reads and partial records wait here
+    size = record_size(Vector2dArray.typecode)
+    while True:
+        data = fp.read(chunk_records * size - len(pending))
+        if data:
+            if not pending:
+                size = record_size(chr(data[0]))
+            pending += data
+            if len(pending) < chunk_records * size:
+                continue
+        whole = len(pending) - len(pending) % size
+        if whole:
+            with memoryview(pending) as memv, memv[:whole] as records:
+                points = decode_points(records)
+            del pending[:whole]
+            yield points
+        if not data:
+            break
+    if pending:
+        raise ValueError('stream ends inside a {}-byte record'.format(size))
+
+
+def write_points(fp, points, chunk_records=CHUNK_RECORDS):
+    if not isinstance(points, Vector2dArray):
+        points = Vector2dArray(points)
+    for start in range(0, len(points), chunk_records):
+        fp.write(encode_points(points[start:start + chunk_records]))
+
+
+if __name__ == '__main__':
+    import io
+    import random
+    import time
+
+    rnd = random.Random(0)
+    points = [Vector2d(rnd.random(), rnd.random()) for _ in range(200000)]
+    stream = b''.join(bytes(p) for p in points)
+
+    t0 = time.perf_counter()
+    one_by_one = [Vector2d.frombytes(stream[i:i + 17]) for i in range(0, len(stream), 17)]
+    print('per-record frombytes: {:.4f}s'.format(time.perf_counter() - t0))
+
+    t0 = time.perf_counter()
+    decoded = decode_points(stream)
+    print('decode_points:        {:.4f}s'.format(time.perf_counter() - t0))
+
+    t0 = time.perf_counter()
+    encoded = encode_points(decoded)
+    print('encode_points:        {:.4f}s'.format(time.perf_counter() - t0))
+
+    fp = io.BytesIO()
+    write_points(fp, decoded)
+    fp.seek(0)
+    read_back = Vector2dArray()
+    for chunk in read_points(fp, chunk_records=1000):
+        read_back.extend(chunk)
+    print(encoded == stream, list(decoded) == one_by_one, read_back == decoded)
@@ -1,9 +1,42 @@
 from array import array
+from collections import namedtuple
 import math
+import weakref
+
+InternInfo = namedtuple('InternInfo', 'hits misses maxsize currsize')
 
 
 class Vector2d:
     typecode = 'd'
+    intern_maxsize = 4096
+    _interned = weakref.WeakValueDictionary()
+    _intern_hits = 0
+    _intern_misses = 0
+
+    @classmethod
+    def intern(cls, x, y):
+        x, y = float(x), float(y)
+        # the signs keep Vector2d(-0.0, 0) from sharing the (0.0, 0.0) instance
+        key = (cls, x, y, math.copysign(1.0, x), math.copysign(1.0, y))
+        vector = cls._interned.get(key)
+        if vector is not None:
+            Vector2d._intern_hits += 1
+            return vector
+        Vector2d._intern_misses += 1
+        vector = cls(x, y)
+        if len(cls._interned) < cls.intern_maxsize:
+            cls._interned[key] = vector
+        return vector
+
+    @classmethod
+    def intern_info(cls):
+        return InternInfo(Vector2d._intern_hits, Vector2d._intern_misses,
+                          cls.intern_maxsize, len(cls._interned))
+
+    @classmethod
+    def intern_clear(cls):
+        cls._interned.clear()
+        Vector2d._intern_hits = Vector2d._intern_misses = 0
 
     @classmethod
     def frombytes(cls, octets):
@@ -26,9 +59,14 @@ class Vector2d:
         return '{}({!r}, {!r})'.format(class_name, *self)
 
     def __str__(self):
+        return str(tuple(self))
+
+    def __bytes__(self):
         return (bytes([ord(self.typecode)]) + bytes(array(self.typecode, self)))
 
     def __eq__(self, other):
+        if self is other:
+            return True
         return tuple(self) == tuple(other)
 
     def __abs__(self):
@@ -66,3 +104,7 @@ if __name__ == '__main__':
     v2 = Vector2d(3.1, 4.2)
     print(hash(v1), hash(v2))
     print({v1, v2})
+
+    grid = [Vector2d.intern(x % 10, y % 10) for x in range(100) for y in range(100)]
+    print(len({id(v) for v in grid}), Vector2d.intern_info())
+    print(grid[0] is Vector2d.intern(0, 0), repr(Vector2d.intern(-0.0, 0)))
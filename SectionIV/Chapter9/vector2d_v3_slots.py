@@ -28,6 +28,9 @@ class Vector2d:
         return '{}({!r}, {!r})'.format(class_name, *self)
 
     def __str__(self):
+        return str(tuple(self))
+
+    def __bytes__(self):
         return (bytes([ord(self.typecode)]) + bytes(array(self.typecode, self)))
 
     def __eq__(self, other):